@@ -17,13 +17,16 @@ from email.utils import parsedate_to_datetime
 from PyQt5.QtCore import QObject, pyqtSignal
 
 from gmail_notifier.config import save_settings
+from gmail_notifier.email_utils import ingest_emails
 
 
 class GmailChecker(QObject):
     """Worker class that checks Gmail for new emails in a background thread.
 
     Signals:
-        new_emails_signal: Emitted with list of email dicts when check completes.
+        new_emails_signal: Emitted with (deduped, grouped) email lists when
+            a check completes. Dedup and thread grouping run here in the
+            worker thread so the GUI thread only consumes the results.
         error_signal: Emitted with error message string on failure.
 
     Attributes:
@@ -32,7 +35,7 @@ class GmailChecker(QObject):
         force_check: Boolean flag to trigger immediate check.
     """
 
-    new_emails_signal = pyqtSignal(list)
+    new_emails_signal = pyqtSignal(list, list)
     error_signal = pyqtSignal(str)
 
     def __init__(self, settings):
@@ -40,6 +43,11 @@ class GmailChecker(QObject):
         self.settings = settings
         self.running = True
         self.force_check = True
+        # UID list and parsed result of the previous check; when the
+        # server returns the same UIDs again, the per-message FETCH and
+        # header parsing can be skipped entirely
+        self._last_uids = None
+        self._last_email_data = None
 
     def check_emails(self):
         """Connect to Gmail via IMAP and fetch unread emails.
@@ -96,8 +104,19 @@ class GmailChecker(QObject):
             message_ids = messages[0].split()
 
             # Check the last 200 unread emails at most
+            recent_uids = message_ids[-200:]
+
+            # If the unseen UID set hasn't changed since the last check,
+            # the headers can't have changed either - reuse the parsed
+            # result and skip the whole FETCH loop. On an idle inbox
+            # this reduces a check to a single SEARCH round-trip.
+            if recent_uids == self._last_uids and self._last_email_data is not None:
+                mail.close()
+                mail.logout()
+                return self._last_email_data
+
             # Use UID FETCH to work with UIDs
-            for msg_uid in message_ids[-200:]:
+            for msg_uid in recent_uids:
                 status, msg_data = mail.uid(
                     "fetch", msg_uid, "(X-GM-THRID BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE)])"
                 )
@@ -160,8 +179,10 @@ class GmailChecker(QObject):
             mail.close()
             mail.logout()
 
-            # Sort by timestamp, newest first
-            email_data.sort(key=lambda e: e.get("timestamp", 0), reverse=True)
+            self._last_uids = recent_uids
+            self._last_email_data = email_data
+
+            # Sorting happens in ingest_emails when the result is processed
             return email_data
 
         except Exception as e:
@@ -244,7 +265,10 @@ class GmailChecker(QObject):
                 emails = self.check_emails()
 
                 if emails is not None:
-                    self.new_emails_signal.emit(emails)
+                    # Dedup and group here in the worker thread so the
+                    # GUI thread doesn't stall on a large inbox
+                    deduped, grouped = ingest_emails(emails)
+                    self.new_emails_signal.emit(deduped, grouped)
 
                 # Update the last check time
                 self.settings["last_check_time"] = current_time
@@ -4,9 +4,93 @@
 
 This module provides functions for performing IMAP operations on emails,
 such as deleting emails by moving them to the Gmail Trash folder.
+
+A single authenticated IMAP connection is kept for the lifetime of the
+process and reused across deletes: the TLS handshake plus LOGIN against
+Gmail costs hundreds of milliseconds, which dominated each delete when
+a fresh connection was opened per call. Access is serialized with a
+lock and the connection is re-established once on a stale session.
 """
 
 import imaplib
+import threading
+
+# Cached process-lifetime connection state, guarded by _conn_lock
+_conn = None
+_conn_user = None
+_conn_lock = threading.Lock()
+
+
+def _get_connection(username, password):
+    """Return the cached authenticated IMAP connection, creating it if needed.
+
+    Caller must hold _conn_lock.
+
+    Args:
+        username: Gmail username/email address.
+        password: Gmail app password.
+
+    Returns:
+        imaplib.IMAP4_SSL: Authenticated connection.
+    """
+    global _conn, _conn_user
+
+    if _conn is not None and _conn_user == username:
+        return _conn
+
+    # Different account or no cached connection - start fresh
+    _drop_connection()
+    conn = imaplib.IMAP4_SSL("imap.gmail.com")
+    conn.login(username, password)
+    _conn = conn
+    _conn_user = username
+    return conn
+
+
+def _drop_connection():
+    """Discard the cached connection, logging out on a best-effort basis.
+
+    Caller must hold _conn_lock.
+    """
+    global _conn, _conn_user
+
+    if _conn is not None:
+        try:
+            _conn.logout()
+        except Exception:
+            pass
+    _conn = None
+    _conn_user = None
+
+
+def close_imap_connection():
+    """Log out and drop the cached IMAP connection.
+
+    Called on application shutdown to release the server session.
+    """
+    with _conn_lock:
+        _drop_connection()
+
+
+def _delete_with_connection(mail, uid_set):
+    """Run the batched trash-move against an authenticated connection.
+
+    Args:
+        mail: Authenticated imaplib.IMAP4_SSL connection.
+        uid_set: Comma-separated string of email UIDs to delete.
+    """
+    mail.select("inbox")
+
+    # Batch all emails into a single UID set; UID commands ensure
+    # we're targeting the correct emails even if the mailbox
+    # changes in the background
+    copy_result = mail.uid("copy", uid_set, "[Gmail]/Trash")
+    if copy_result[0] == "OK":
+        mail.uid("store", uid_set, "+FLAGS", "\\Deleted")
+
+    # Expunge all deleted emails at once
+    mail.expunge()
+    mail.close()
 
 
 def delete_emails_imap(username, password, email_ids):
@@ -16,11 +100,17 @@ def delete_emails_imap(username, password, email_ids):
     to avoid blocking the UI.
 
     For Gmail, the proper way to delete is:
-    1. Use UID to identify messages (stable across mailbox changes)
-    2. Copy the message to [Gmail]/Trash using UID
-    3. Mark the original as deleted using UID
+    1. Use UIDs to identify messages (stable across mailbox changes)
+    2. Copy the messages to [Gmail]/Trash using a single UID COPY
+    3. Mark the originals as deleted using a single UID STORE
     4. Expunge to remove from inbox
 
+    All UIDs are sent as one comma-separated set, so deleting an
+    N-message thread costs a constant number of IMAP round-trips
+    instead of 2N. The authenticated connection is reused across
+    calls; if the cached session has gone stale, it is reopened once
+    and the delete retried.
+
     Args:
         username: Gmail username/email address.
         password: Gmail app password.
@@ -35,30 +125,21 @@ def delete_emails_imap(username, password, email_ids):
     if not email_ids:
         return
 
-    mail = imaplib.IMAP4_SSL("imap.gmail.com")
-    try:
-        mail.login(username, password)
-        mail.select("inbox")
-
-        # Delete all emails in the list using UID commands
-        for eid in email_ids:
-            msg_uid = eid.encode() if isinstance(eid, str) else eid
+    uid_set = ",".join(
+        eid.decode() if isinstance(eid, bytes) else str(eid)
+        for eid in email_ids
+    )
 
-            # Use UID commands to ensure we're targeting the correct email
-            # even if the mailbox changes in the background
-            copy_result = mail.uid("copy", msg_uid, "[Gmail]/Trash")
-            if copy_result[0] == "OK":
-                mail.uid("store", msg_uid, "+FLAGS", "\\Deleted")
-
-        # Expunge all deleted emails at once
-        mail.expunge()
-
-        mail.close()
-        mail.logout()
-    except Exception:
-        # Try to clean up connection on error
+    with _conn_lock:
         try:
-            mail.logout()
-        except Exception:
-            pass
-        raise
+            _delete_with_connection(_get_connection(username, password), uid_set)
+        except (imaplib.IMAP4.abort, imaplib.IMAP4.error, OSError):
+            # Stale or broken session - reconnect once and retry
+            _drop_connection()
+            try:
+                _delete_with_connection(
+                    _get_connection(username, password), uid_set
+                )
+            except Exception:
+                _drop_connection()
+                raise
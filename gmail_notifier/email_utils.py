@@ -7,6 +7,26 @@ This module provides pure functions for processing email data:
 - Grouping emails by thread for display
 """
 
+from operator import itemgetter
+
+# C-level sort key; much cheaper per comparison than a lambda. Emails
+# get their 'timestamp' defaulted at ingest so the key never misses.
+_timestamp_key = itemgetter("timestamp")
+
+
+def thread_key(email):
+    """Return the grouping key for an email's thread.
+
+    Emails without a thread_id each count as their own thread.
+
+    Args:
+        email: Email dict with 'thread_id' and 'id' keys.
+
+    Returns:
+        str: The thread_id, or a per-email synthetic key when missing.
+    """
+    return email.get("thread_id") or f"_no_thread_{email.get('id', '')}"
+
 
 def dedup_emails(emails):
     """Remove duplicate emails by ID and sort by timestamp.
@@ -23,9 +43,10 @@ def dedup_emails(emails):
         email_id = str(email.get("id"))
         if email_id and email_id not in seen_ids:
             seen_ids.add(email_id)
+            email.setdefault("timestamp", 0)
             deduped.append(email)
     # Always sort by timestamp, newest first
-    deduped.sort(key=lambda e: e.get("timestamp", 0), reverse=True)
+    deduped.sort(key=_timestamp_key, reverse=True)
     return deduped
 
 
@@ -50,6 +71,7 @@ def group_by_thread(emails):
     # Group emails by thread_id
     threads = {}
     for email in emails:
+        email.setdefault("timestamp", 0)
         thread_id = email.get("thread_id", "")
         # If no thread_id, treat each email as its own thread
         if not thread_id:
@@ -63,7 +85,7 @@ def group_by_thread(emails):
     grouped = []
     for thread_id, thread_emails in threads.items():
         # Sort thread emails by timestamp, newest first
-        thread_emails.sort(key=lambda e: e.get("timestamp", 0), reverse=True)
+        thread_emails.sort(key=_timestamp_key, reverse=True)
         # Take the newest email as the representative
         newest = thread_emails[0].copy()
         # Add count of unread emails in this thread
@@ -71,10 +93,68 @@ def group_by_thread(emails):
         grouped.append(newest)
 
     # Sort all threads by their newest email's timestamp, newest first
-    grouped.sort(key=lambda e: e.get("timestamp", 0), reverse=True)
+    grouped.sort(key=_timestamp_key, reverse=True)
     return grouped
 
 
+def ingest_emails(emails):
+    """Deduplicate and group emails by thread with minimal passes.
+
+    Fuses dedup_emails and group_by_thread: one pass builds the by-ID
+    dedup map, then the thread map is built over the sorted result, so
+    representatives and tie-breaking match the two-step composition
+    exactly without per-thread sorts or intermediate list copies.
+
+    The 'id' and 'thread_id' fields are normalized to strings in place,
+    so downstream consumers can compare them without re-wrapping in
+    str() on every access.
+
+    Args:
+        emails: List of email dicts with 'id', 'thread_id', 'timestamp' keys.
+
+    Returns:
+        tuple: (deduped, grouped) lists, both sorted newest first.
+               deduped matches dedup_emails() output; grouped matches
+               group_by_thread() output.
+    """
+    seen = {}
+    for email in emails:
+        email_id = str(email.get("id"))
+        if not email_id or email_id in seen:
+            continue
+        email["id"] = email_id
+        email.setdefault("timestamp", 0)
+        thread_id = email.get("thread_id", "")
+        if thread_id:
+            email["thread_id"] = str(thread_id)
+        seen[email_id] = email
+
+    deduped = sorted(seen.values(), key=_timestamp_key, reverse=True)
+
+    # Walk the sorted list so the first email seen per thread is its
+    # newest, with timestamp ties broken by sort position - exactly
+    # the representative group_by_thread would pick
+    newest_by_thread = {}
+    thread_counts = {}
+    for email in deduped:
+        key = thread_key(email)
+        if key in newest_by_thread:
+            thread_counts[key] += 1
+        else:
+            newest_by_thread[key] = email
+            thread_counts[key] = 1
+
+    # First-seen order over the sorted list already has the
+    # representatives newest first, so no final sort is needed
+    grouped = []
+    for key, newest in newest_by_thread.items():
+        representative = newest.copy()
+        representative["thread_count"] = thread_counts[key]
+        grouped.append(representative)
+
+    return deduped, grouped
+
+
 def find_thread_email_ids(emails, email_id):
     """Find all email IDs belonging to the same thread as the given email.
 
@@ -10,7 +10,6 @@ for showing email notifications via both Qt tray and system notifications.
 import os
 import subprocess
 import threading
-import webbrowser
 
 from PyQt5.QtWidgets import QSystemTrayIcon
 
@@ -82,6 +81,11 @@ def send_system_notification(
             # Handle user action
             action = result.stdout.strip()
             if action == "open":
+                # Imported here: only needed when a notification is
+                # actually clicked, and this already runs off the UI
+                # thread
+                import webbrowser
+
                 url = open_url if open_url else "https://mail.google.com"
                 webbrowser.open(url)
             elif action == "snooze" and snooze_callback is not None:
@@ -131,6 +135,42 @@ def show_email_notification(
     )
 
 
+def show_grouped_notification(
+    tray_icon, thread_emails, extra_count=0, snooze_callback=None
+):
+    """Show one notification summarizing several new email threads.
+
+    Used instead of a chain of per-thread notifications when several
+    threads arrive in the same check - one notification is far less
+    intrusive and avoids the timer-driven notification queue.
+
+    Args:
+        tray_icon: QSystemTrayIcon instance to show message on.
+        thread_emails: Grouped email dicts (one per thread) to preview.
+        extra_count: Number of further threads not previewed; the
+            caller bounds the preview list.
+        snooze_callback: Optional callback for snooze action.
+    """
+    count = len(thread_emails) + extra_count
+    title = f"{count} new emails"
+
+    lines = [f"{e['sender']}: {e['subject'][:60]}" for e in thread_emails]
+    if extra_count:
+        lines.append(f"...and {extra_count} more")
+    body = "\n".join(lines)
+
+    # Qt tray icon notification
+    tray_icon.showMessage(
+        title,
+        body,
+        QSystemTrayIcon.Information,
+        5000,
+    )
+
+    # System notification with snooze option
+    send_system_notification(title, body, snooze_callback=snooze_callback)
+
+
 def show_summary_notification(tray_icon, count, snooze_callback=None):
     """Show summary notification for additional emails.
 
@@ -17,13 +17,55 @@ from gmail_notifier.config import ICON_PATH
 SNOOZE_OPACITY = 0.35
 
 
+# Painter resources shared by all badge compositions
+ERROR_BADGE_COLOR = QColor("#ff9800")  # Material Orange
+SNOOZE_BADGE_COLOR = QColor("#4da6ff")  # Blue color
+UNREAD_BADGE_COLOR = QColor("#1D99F3")  # KDE Blue
+_WHITE = QColor("white")
+
+# Rasterized 64x64 base pixmaps keyed by QIcon cache key, so the
+# (possibly SVG) base icon is only rendered once per icon
+_base_pixmaps = {}
+
+# Fully composed badge icons keyed by (base cache key, unread, snoozed,
+# error). Only a handful of states exist, so each composition is
+# painted exactly once per process
+_badge_icons = {}
+
+# Bold badge fonts keyed by pixel size, built lazily
+_badge_fonts = {}
+
+
+def _badge_font(pixel_size):
+    """Return a shared bold font with the given pixel size.
+
+    Args:
+        pixel_size: Font pixel size.
+
+    Returns:
+        QFont: Cached bold font instance.
+    """
+    font = _badge_fonts.get(pixel_size)
+    if font is None:
+        font = QFont()
+        font.setPixelSize(pixel_size)
+        font.setBold(True)
+        _badge_fonts[pixel_size] = font
+    return font
+
+
 # Fallback paths where Gmail icon might be installed on the system
-GMAIL_ICON_FALLBACK_PATHS = [
+GMAIL_ICON_FALLBACK_PATHS = (
     "/usr/share/icons/hicolor/scalable/apps/gmail.svg",
     "/usr/share/icons/hicolor/48x48/apps/gmail.png",
     "/usr/share/icons/breeze/apps/48/gmail.svg",
     "/usr/share/pixmaps/gmail.png",
-]
+)
+
+
+# Cached result of get_gmail_icon(); the resolution never changes at
+# runtime, so the path checks only need to run once per process
+_gmail_icon = None
 
 
 def get_gmail_icon():
@@ -34,6 +76,21 @@ def get_gmail_icon():
     2. System-installed Gmail icons
     3. Fallback to system 'mail-unread' theme icon
 
+    The resolved icon is cached after the first call; this function is
+    hit on every tray refresh and the stat calls add up.
+
+    Returns:
+        QIcon: Gmail icon or fallback mail-unread theme icon.
+    """
+    global _gmail_icon
+    if _gmail_icon is None:
+        _gmail_icon = _resolve_gmail_icon()
+    return _gmail_icon
+
+
+def _resolve_gmail_icon():
+    """Resolve the Gmail icon from disk or the system theme.
+
     Returns:
         QIcon: Gmail icon or fallback mail-unread theme icon.
     """
@@ -41,13 +98,12 @@ def get_gmail_icon():
     if os.path.exists(ICON_PATH):
         return QIcon(ICON_PATH)
 
-    # Then check system paths
-    for path in GMAIL_ICON_FALLBACK_PATHS:
-        if os.path.exists(path):
-            return QIcon(path)
-
-    # If the icon is not found anywhere, use a system theme icon
-    return QIcon.fromTheme("mail-unread")
+    # Then check system paths, falling back to a system theme icon
+    # if the icon is not found anywhere
+    return next(
+        (QIcon(path) for path in GMAIL_ICON_FALLBACK_PATHS if os.path.exists(path)),
+        QIcon.fromTheme("mail-unread"),
+    )
 
 
 def create_badge_icon(base_icon, has_unread=False, is_snoozed=False, is_error=False):
@@ -71,12 +127,26 @@ def create_badge_icon(base_icon, has_unread=False, is_snoozed=False, is_error=Fa
     if not has_unread and not is_snoozed and not is_error:
         return base_icon
 
-    # Create a pixmap from the icon
+    # Reuse the finished composition if this state was painted before;
+    # repeat transitions then skip the QPainter session entirely
+    cache_key = base_icon.cacheKey()
+    state_key = (cache_key, has_unread, is_snoozed, is_error)
+    cached = _badge_icons.get(state_key)
+    if cached is not None:
+        return cached
+
+    # Rasterize the icon once and reuse the pixmap on later calls
     # Size 64x64 provides enough resolution for most trays
-    pixmap = base_icon.pixmap(64, 64)
-    if pixmap.isNull():
+    base_pixmap = _base_pixmaps.get(cache_key)
+    if base_pixmap is None:
+        base_pixmap = base_icon.pixmap(64, 64)
+        _base_pixmaps[cache_key] = base_pixmap
+    if base_pixmap.isNull():
         return base_icon
 
+    # Paint on a copy so the cached base stays pristine
+    pixmap = QPixmap(base_pixmap)
+
     # For snoozed state, create a faded version of the icon
     if is_snoozed:
         pixmap = _create_faded_pixmap(pixmap, SNOOZE_OPACITY)
@@ -93,7 +163,9 @@ def create_badge_icon(base_icon, has_unread=False, is_snoozed=False, is_error=Fa
 
     painter.end()
 
-    return QIcon(pixmap)
+    icon = QIcon(pixmap)
+    _badge_icons[state_key] = icon
+    return icon
 
 
 def _create_faded_pixmap(pixmap, opacity):
@@ -127,18 +199,15 @@ def _draw_error_badge(painter, pixmap):
         pixmap: The pixmap being painted on.
     """
     # Orange circle background
-    painter.setBrush(QColor("#ff9800"))  # Material Orange
+    painter.setBrush(ERROR_BADGE_COLOR)
     painter.setPen(Qt.NoPen)
     dot_size = 24
     # Position at bottom-right
     painter.drawEllipse(pixmap.width() - dot_size - 2, pixmap.height() - dot_size - 2, dot_size, dot_size)
 
     # White exclamation mark
-    painter.setPen(QColor("white"))
-    font = QFont()
-    font.setPixelSize(18)
-    font.setBold(True)
-    painter.setFont(font)
+    painter.setPen(_WHITE)
+    painter.setFont(_badge_font(18))
     painter.drawText(
         QRect(pixmap.width() - dot_size - 2, pixmap.height() - dot_size - 2, dot_size, dot_size),
         Qt.AlignCenter,
@@ -153,11 +222,8 @@ def _draw_snooze_badge(painter, pixmap):
         painter: Active QPainter on the pixmap.
         pixmap: The pixmap being painted on.
     """
-    painter.setPen(QColor("#4da6ff"))  # Blue color
-    font = QFont()
-    font.setPixelSize(28)
-    font.setBold(True)
-    painter.setFont(font)
+    painter.setPen(SNOOZE_BADGE_COLOR)
+    painter.setFont(_badge_font(28))
     # Draw at bottom right
     painter.drawText(
         pixmap.rect().adjusted(0, 5, -4, 0), Qt.AlignRight | Qt.AlignBottom, "Z"
@@ -172,7 +238,7 @@ def _draw_unread_badge(painter, pixmap):
         pixmap: The pixmap being painted on.
     """
     dot_size = 20  # Relative to 64x64
-    painter.setBrush(QColor("#1D99F3"))  # KDE Blue
+    painter.setBrush(UNREAD_BADGE_COLOR)
     painter.setPen(Qt.NoPen)
     # Position at bottom-right
     painter.drawEllipse(pixmap.width() - dot_size - 2, pixmap.height() - dot_size - 2, dot_size, dot_size)
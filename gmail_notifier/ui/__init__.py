@@ -6,10 +6,25 @@ This package contains all Qt-based UI components:
 - ConfigDialog: Settings configuration dialog
 - EmailListPopup: Popup showing list of unread emails
 - GmailNotifier: Main application class with system tray
-"""
 
-from gmail_notifier.ui.config_dialog import ConfigDialog
-from gmail_notifier.ui.email_popup import EmailListPopup
-from gmail_notifier.ui.main_app import GmailNotifier
+The re-exports resolve lazily (PEP 562) so importing the package - or
+main_app through it - doesn't pull in the dialog and popup modules
+before their windows are first opened.
+"""
 
 __all__ = ["ConfigDialog", "EmailListPopup", "GmailNotifier"]
+
+_SUBMODULES = {
+    "ConfigDialog": "gmail_notifier.ui.config_dialog",
+    "EmailListPopup": "gmail_notifier.ui.email_popup",
+    "GmailNotifier": "gmail_notifier.ui.main_app",
+}
+
+
+def __getattr__(name):
+    module_name = _SUBMODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    return getattr(import_module(module_name), name)
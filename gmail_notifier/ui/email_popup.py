@@ -15,18 +15,118 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
+    QToolButton,
     QWidget,
     QSizePolicy,
+    QSpacerItem,
     QScrollArea,
+    QStackedWidget,
     QFrame,
     QMessageBox,
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QEvent
-from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt, pyqtSignal, QEvent, QRunnable, QSize, QThreadPool
+from PyQt5.QtGui import QFont, QIcon
 
 from gmail_notifier.tray_icon import get_gmail_icon
 
 
+# Fixed height of one email row. A stable height keeps the scroll
+# area's relayout cost linear: adding a row never re-measures the
+# word-wrap of earlier rows.
+_ROW_HEIGHT = 56
+
+# Popup-level style sheets, frozen at module scope so Python allocates
+# each string once per process and Qt re-parses them at most once per
+# popup construction
+_CONTAINER_QSS = """
+    QWidget {
+        background-color: #1e1e1e;
+        border: 1px solid #3d3d3d;
+    }
+"""
+
+_OPEN_GMAIL_BTN_QSS = """
+    QPushButton {
+        background-color: #1e1e1e;
+        color: #4da6ff;
+        border: none;
+        border-bottom: 1px solid #2d2d2d;
+        padding: 12px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #2d2d2d;
+    }
+"""
+
+_SCROLL_AREA_QSS = """
+    QScrollArea {
+        border: none;
+        background-color: #1e1e1e;
+    }
+    QScrollBar:vertical {
+        background-color: #1e1e1e;
+        width: 8px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: #3d3d3d;
+        border-radius: 4px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+"""
+
+_CONTENT_QSS = "background-color: #1e1e1e;"
+
+_NO_EMAILS_QSS = """
+    color: #888888;
+    padding: 20px;
+    background-color: #1e1e1e;
+"""
+
+# Per-row style sheets hoisted to module scope so every row shares the
+# same string instead of re-allocating and re-tokenizing it per widget
+_ROW_QSS = """
+    QFrame {
+        background-color: #1e1e1e;
+        border: none;
+        border-bottom: 1px solid #2d2d2d;
+    }
+    QFrame:hover {
+        background-color: #2d2d2d;
+    }
+"""
+
+_ROW_LABEL_QSS = "color: #e0e0e0; background: transparent; border: none;"
+
+_ROW_SUBJECT_QSS = "color: #aaaaaa; background: transparent; border: none;"
+
+class _OpenUrlTask(QRunnable):
+    """Task that opens a URL in the default browser off the UI thread.
+
+    webbrowser.open forks a subprocess (xdg-open on Linux), which can
+    block for tens of milliseconds; running it on the global thread
+    pool lets the popup close immediately.
+    """
+
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+
+    def run(self):
+        webbrowser.open(self.url)
+
+
+def _open_url_async(url):
+    """Open a URL in the browser without blocking the UI thread.
+
+    Args:
+        url: URL to open.
+    """
+    QThreadPool.globalInstance().start(_OpenUrlTask(url))
+
+
 class EmailListPopup(QDialog):
     """Popup dialog showing list of unread emails.
 
@@ -43,6 +143,18 @@ class EmailListPopup(QDialog):
     delete_requested = pyqtSignal(str)
     reshow_requested = pyqtSignal()
 
+    # Shared trash icon for all delete buttons. QIcon.fromTheme walks
+    # XDG theme directories, so resolve it once and let QIcon's implicit
+    # sharing cover every row.
+    _TRASH_ICON = None
+
+    # Shared bold font for sender labels, created once per process
+    _SENDER_FONT = None
+
+    # Extra rows to materialize beyond the visible viewport so small
+    # scroll steps don't immediately hit widget construction
+    _MATERIALIZE_BUFFER = 8
+
     def __init__(self, emails, gmail_url, parent=None):
         """Initialize the email list popup.
 
@@ -54,16 +166,43 @@ class EmailListPopup(QDialog):
         super().__init__(parent)
         self.emails = emails
         self.gmail_url = gmail_url
+        # Live row widgets keyed by email ID for incremental updates
+        self._rows = {}
+        # Emails beyond the visible range, kept as data until scrolled to
+        self._pending_emails = []
         self.setWindowFlags(
             Qt.Window | Qt.WindowStaysOnTopHint | Qt.WindowCloseButtonHint
         )
         self.setWindowTitle("Gmail Notifier")
         self.setWindowIcon(get_gmail_icon())
         self._event_filter_installed = False
+        self._ui_built = False
+        if EmailListPopup._TRASH_ICON is None:
+            EmailListPopup._TRASH_ICON = QIcon.fromTheme("user-trash")
+        if EmailListPopup._SENDER_FONT is None:
+            sender_font = QFont()
+            sender_font.setBold(True)
+            EmailListPopup._SENDER_FONT = sender_font
         self.init_ui()
 
+    def set_gmail_url(self, gmail_url):
+        """Update the URL opened by the "Open Gmail Inbox" button.
+
+        Args:
+            gmail_url: New URL to open.
+        """
+        self.gmail_url = gmail_url
+
     def init_ui(self):
-        """Initialize the popup UI components."""
+        """Initialize the popup UI components.
+
+        Only builds the widget tree once; subsequent calls are no-ops
+        so a long-lived popup can be reused across tray clicks.
+        """
+        if self._ui_built:
+            return
+        self._ui_built = True
+
         # Main layout
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -72,12 +211,7 @@ class EmailListPopup(QDialog):
 
         # Container widget with dark background
         container = QWidget()
-        container.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-                border: 1px solid #3d3d3d;
-            }
-        """)
+        container.setStyleSheet(_CONTAINER_QSS)
         container_layout = QVBoxLayout(container)
         container_layout.setContentsMargins(0, 0, 0, 0)
         container_layout.setSpacing(0)
@@ -85,19 +219,7 @@ class EmailListPopup(QDialog):
         # Open Gmail button at top
         open_gmail_btn = QPushButton("Open Gmail Inbox")
         open_gmail_btn.setCursor(Qt.PointingHandCursor)
-        open_gmail_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1e1e1e;
-                color: #4da6ff;
-                border: none;
-                border-bottom: 1px solid #2d2d2d;
-                padding: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2d2d2d;
-            }
-        """)
+        open_gmail_btn.setStyleSheet(_OPEN_GMAIL_BTN_QSS)
         open_gmail_btn.clicked.connect(self._on_open_gmail)
         container_layout.addWidget(open_gmail_btn)
 
@@ -105,35 +227,48 @@ class EmailListPopup(QDialog):
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #1e1e1e;
-            }
-            QScrollBar:vertical {
-                background-color: #1e1e1e;
-                width: 8px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #3d3d3d;
-                border-radius: 4px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        self.scroll_area.setStyleSheet(_SCROLL_AREA_QSS)
 
         # Content widget inside scroll area
         self.content_widget = QWidget()
-        self.content_widget.setStyleSheet("background-color: #1e1e1e;")
+        self.content_widget.setStyleSheet(_CONTENT_QSS)
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         self.content_layout.setSpacing(0)
 
+        # Persistent stretch keeps items pushed to the top; rows are
+        # always inserted before it so it never needs to be rebuilt
+        self._stretch = QSpacerItem(
+            0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding
+        )
+        self.content_layout.addSpacerItem(self._stretch)
+
+        # Fixed-height filler standing in for rows that are scrolled
+        # out of view and not yet materialized; rows are always
+        # inserted above it so it stays between the rows and the stretch
+        self._filler = QWidget()
+        self._filler.setFixedHeight(0)
+        self.content_layout.insertWidget(0, self._filler)
+
         self._add_email_items()
 
         self.scroll_area.setWidget(self.content_widget)
-        container_layout.addWidget(self.scroll_area)
+        # Materialize further rows on demand as the user scrolls
+        self.scroll_area.verticalScrollBar().valueChanged.connect(
+            self._materialize_visible
+        )
+
+        # "No new emails" placeholder, built once; a stacked widget
+        # switches between it and the list without any widget churn
+        self._no_emails_label = QLabel("No new emails")
+        self._no_emails_label.setStyleSheet(_NO_EMAILS_QSS)
+        self._no_emails_label.setAlignment(Qt.AlignCenter)
+
+        self.stack = QStackedWidget()
+        self.stack.addWidget(self._no_emails_label)  # page 0: empty state
+        self.stack.addWidget(self.scroll_area)  # page 1: email list
+        self.stack.setCurrentIndex(0 if not self.emails else 1)
+        container_layout.addWidget(self.stack)
 
         main_layout.addWidget(container)
         self._resize_to_content()
@@ -150,6 +285,8 @@ class EmailListPopup(QDialog):
         if app and not self._event_filter_installed:
             app.installEventFilter(self)
             self._event_filter_installed = True
+        # Viewport geometry is final now; top up the materialized rows
+        self._materialize_visible()
 
     def closeEvent(self, event):
         """Remove event filter on close."""
@@ -160,8 +297,14 @@ class EmailListPopup(QDialog):
         super().closeEvent(event)
 
     def eventFilter(self, obj, event):
-        if event.type() == QEvent.MouseButtonPress and self.isVisible():
-            if not self.geometry().contains(event.globalPos()):
+        if event.type() == QEvent.MouseButtonPress:
+            # Clicks on a row's text area: the container carries the
+            # email id/link as properties
+            email_id = obj.property("email_id")
+            if email_id is not None:
+                self._on_email_clicked(obj.property("email_link"), email_id)
+                return True
+            if self.isVisible() and not self.geometry().contains(event.globalPos()):
                 self.close()
         return super().eventFilter(obj, event)
 
@@ -171,101 +314,192 @@ class EmailListPopup(QDialog):
         return super().event(event)
 
     def _add_email_items(self):
-        """Add email items to the content layout."""
-        if self.emails:
-            for email_data in self.emails:
+        """Add email items to the content layout.
+
+        Only rows within the visible range get real widgets; the rest
+        are kept as data in `_pending_emails` behind the filler.
+        """
+        # Suspend painting so adding N rows costs one layout pass and
+        # one repaint instead of one per row
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            capacity = self._visible_capacity()
+            for email_data in self.emails[:capacity]:
                 self._add_email_row(email_data)
-        else:
-            # No emails message
-            no_emails_label = QLabel("No new emails")
-            no_emails_label.setStyleSheet("""
-                color: #888888;
-                padding: 20px;
-                background-color: #1e1e1e;
-            """)
-            no_emails_label.setAlignment(Qt.AlignCenter)
-            self.content_layout.addWidget(no_emails_label)
-
-        # Add stretch to push items to top
-        self.content_layout.addStretch()
-
-    def _add_email_row(self, email_data):
-        """Add a single email row with text and delete button.
+            self._pending_emails = list(self.emails[capacity:])
+            self._update_filler()
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+
+    def _visible_capacity(self):
+        """Number of rows worth materializing for the current scroll view.
+
+        Returns:
+            int: Row count covering the scrolled-to area plus a buffer.
+        """
+        viewport_height = self.scroll_area.viewport().height()
+        if viewport_height <= 0:
+            # Not laid out yet - assume the maximum popup height
+            viewport_height = self._MAX_HEIGHT
+        scroll_value = self.scroll_area.verticalScrollBar().value()
+        return (scroll_value + viewport_height) // _ROW_HEIGHT + self._MATERIALIZE_BUFFER
+
+    def _update_filler(self):
+        """Resize the filler to stand in for all unmaterialized rows."""
+        self._filler.setFixedHeight(len(self._pending_emails) * _ROW_HEIGHT)
+
+    def _materialize_visible(self, value=0):
+        """Create widgets for pending rows that scrolled into view.
 
         Args:
-            email_data: Dict with keys: sender, subject, id, link, thread_count, thread_email_ids.
+            value: Scrollbar position (unused; recomputed from the bar).
+        """
+        if not self._pending_emails:
+            return
+
+        capacity = self._visible_capacity()
+        if len(self._rows) >= capacity:
+            return
+
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            while self._pending_emails and len(self._rows) < capacity:
+                self._add_email_row(self._pending_emails.pop(0))
+            self._update_filler()
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _subject_text(email_data):
+        """Build the subject line text for an email row.
+
+        Args:
+            email_data: Dict with keys: subject, thread_count.
+
+        Returns:
+            str: Subject, with the thread count appended when > 1.
         """
-        sender = email_data.get("sender", "Unknown")
         subject = email_data.get("subject", "(No Subject)")
-        email_id = email_data.get("id")
-        link = email_data.get("link")
         thread_count = email_data.get("thread_count", 1)
-        thread_email_ids = email_data.get("thread_email_ids", [email_id])
 
         # Add thread count to subject if more than 1 email in thread
         if thread_count > 1:
             subject = f"{subject} ({thread_count})"
 
+        return subject
+
+    @staticmethod
+    def _row_key(email_data):
+        """Build a comparison key describing a row's displayed state.
+
+        Args:
+            email_data: Dict describing a grouped email.
+
+        Returns:
+            tuple: Values that require a row refresh when they change.
+        """
+        return (
+            email_data.get("sender", "Unknown"),
+            email_data.get("subject", "(No Subject)"),
+            email_data.get("thread_count", 1),
+            tuple(email_data.get("thread_email_ids", [email_data.get("id")])),
+        )
+
+    def _add_email_row(self, email_data, index=None):
+        """Add a single email row with text and delete button.
+
+        The row is registered in `self._rows` by email ID so later
+        updates can mutate it in place instead of rebuilding it.
+
+        Args:
+            email_data: Dict with keys: sender, subject, id, link, thread_count, thread_email_ids.
+            index: Optional layout position; defaults to after the last row.
+        """
+        email_id = str(email_data.get("id"))
+        link = email_data.get("link")
+        thread_email_ids = email_data.get("thread_email_ids", [email_id])
+
         # Row container
         row_widget = QFrame()
-        row_widget.setStyleSheet("""
-            QFrame {
-                background-color: #1e1e1e;
-                border: none;
-                border-bottom: 1px solid #2d2d2d;
-            }
-            QFrame:hover {
-                background-color: #2d2d2d;
-            }
-        """)
+        row_widget.setStyleSheet(_ROW_QSS)
+        row_widget.setFixedHeight(_ROW_HEIGHT)
         row_layout = QHBoxLayout(row_widget)
         row_layout.setContentsMargins(10, 8, 8, 8)
         row_layout.setSpacing(8)
 
-        # Email text label
-        text_label = QLabel(
-            f"<b>{sender}</b><br><span style='color: #aaaaaa;'>{subject}</span>"
-        )
-        text_label.setStyleSheet(
-            "color: #e0e0e0; background: transparent; border: none;"
-        )
-        text_label.setWordWrap(True)
-        text_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
-        text_label.setCursor(Qt.PointingHandCursor)
-        text_label.mousePressEvent = (
-            lambda event, l=link, eid=email_id: self._on_email_clicked(l, eid)
-        )
-        row_layout.addWidget(text_label)
-
-        # Delete button with trash icon
-        delete_btn = QPushButton()
-        delete_btn.setIcon(QIcon.fromTheme("user-trash"))
+        # Email text: two stacked plain-text labels (bold sender over
+        # gray subject). Plain text skips Qt's rich-text engine per row
+        # and avoids HTML injection from sender/subject content.
+        text_widget = QWidget()
+        text_layout = QVBoxLayout(text_widget)
+        text_layout.setContentsMargins(0, 0, 0, 0)
+        text_layout.setSpacing(2)
+
+        sender_label = QLabel(email_data.get("sender", "Unknown"))
+        sender_label.setTextFormat(Qt.PlainText)
+        sender_label.setFont(EmailListPopup._SENDER_FONT)
+        sender_label.setStyleSheet(_ROW_LABEL_QSS)
+        text_layout.addWidget(sender_label)
+
+        subject_label = QLabel(self._subject_text(email_data))
+        subject_label.setTextFormat(Qt.PlainText)
+        subject_label.setStyleSheet(_ROW_SUBJECT_QSS)
+        text_layout.addWidget(subject_label)
+
+        # Let clicks on the labels fall through to the container, which
+        # carries the email's id/link as properties; a single event
+        # filter on the popup handles all rows without per-row closures
+        sender_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        subject_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        text_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
+        text_widget.setCursor(Qt.PointingHandCursor)
+        text_widget.setProperty("email_id", email_id)
+        text_widget.setProperty("email_link", link)
+        text_widget.installEventFilter(self)
+        row_layout.addWidget(text_widget)
+
+        # Delete button with trash icon. QToolButton's autoRaise hover
+        # highlight is drawn natively by QStyle, avoiding the QSS
+        # repolish a styled QPushButton pays on every enter/leave.
+        delete_btn = QToolButton()
+        delete_btn.setAutoRaise(True)
+        delete_btn.setIcon(EmailListPopup._TRASH_ICON)
+        delete_btn.setIconSize(QSize(18, 18))
         delete_btn.setFixedSize(28, 28)
         delete_btn.setCursor(Qt.PointingHandCursor)
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #ff5555;
-            }
-        """)
-        # Capture the complete list of email IDs at button creation time
-        # This prevents race conditions from background email updates
-        delete_btn.clicked.connect(
-            lambda checked, ids=thread_email_ids: self._on_delete_clicked(ids)
-        )
+        # Store the complete list of email IDs on the button itself so
+        # all rows share one slot; the property is refreshed by the
+        # update diff to prevent races with background email updates
+        delete_btn.setProperty("thread_email_ids", thread_email_ids)
+        delete_btn.clicked.connect(self._on_delete_btn_clicked)
         row_layout.addWidget(delete_btn, 0, Qt.AlignTop)
 
-        self.content_layout.addWidget(row_widget)
+        # Insert after the existing rows, before the filler and stretch
+        if index is None:
+            index = self.content_layout.indexOf(self._filler)
+        self.content_layout.insertWidget(index, row_widget)
+        self._rows[email_id] = (
+            row_widget,
+            sender_label,
+            subject_label,
+            delete_btn,
+            self._row_key(email_data),
+        )
 
     def _on_open_gmail(self):
         """Open Gmail inbox in browser."""
-        webbrowser.open(self.gmail_url)
+        _open_url_async(self.gmail_url)
         self.close()
 
+    def _on_delete_btn_clicked(self):
+        """Shared slot for all row delete buttons.
+
+        Reads the thread's email IDs from the clicked button's property.
+        """
+        thread_email_ids = self.sender().property("thread_email_ids")
+        if thread_email_ids:
+            self._on_delete_clicked(thread_email_ids)
+
     def _on_delete_clicked(self, thread_email_ids):
         """Handle delete button click with confirmation.
 
@@ -301,13 +535,27 @@ class EmailListPopup(QDialog):
         if email_id:
             self.email_clicked.emit(str(email_id))
         if link:
-            webbrowser.open(link)
+            _open_url_async(link)
         self.close()
 
+    # Height of the "Open Gmail Inbox" header button
+    _HEADER_HEIGHT = 44
+
+    # Maximum popup height; the scroll area handles overflow beyond it
+    _MAX_HEIGHT = 550
+
     def _resize_to_content(self):
-        """Set fixed popup size."""
-        # Fixed height - scroll area handles overflow
-        self.resize(380, 550)
+        """Size the popup to fit its rows, capped at the maximum height.
+
+        With few unread emails this shrinks the window so Qt lays out
+        and paints only the pixels that are actually used.
+        """
+        row_count = max(1, len(self.emails))
+        height = min(
+            self._MAX_HEIGHT,
+            self._HEADER_HEIGHT + row_count * _ROW_HEIGHT + 8,
+        )
+        self.resize(380, height)
 
     def update_emails(self, emails):
         """Update the email list with new emails.
@@ -317,12 +565,71 @@ class EmailListPopup(QDialog):
         """
         self.emails = emails
 
-        # Clear existing email rows
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Batch the whole diff into a single layout pass and repaint
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            self._apply_email_diff(emails)
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
 
-        # Re-add email items
-        self._add_email_items()
-        # Don't resize - keep fixed height
+    def _apply_email_diff(self, emails):
+        """Apply an incremental row diff against the current rows.
+
+        Only rows within the visible range are materialized; the tail
+        of the list is stored as data behind the filler and built on
+        demand by `_materialize_visible`.
+
+        Args:
+            emails: New list of email dicts in display order.
+        """
+        capacity = self._visible_capacity()
+        prefix = emails[:capacity]
+        prefix_ids = {str(e.get("id")) for e in prefix}
+
+        # Remove rows whose email is gone or fell out of the
+        # materialized range
+        for email_id in list(self._rows):
+            if email_id not in prefix_ids:
+                row_widget = self._rows.pop(email_id)[0]
+                self.content_layout.removeWidget(row_widget)
+                row_widget.deleteLater()
+
+        # Add new rows and relabel changed ones, in display order
+        for index, email_data in enumerate(prefix):
+            email_id = str(email_data.get("id"))
+            existing = self._rows.get(email_id)
+            if existing is None:
+                self._add_email_row(email_data, index)
+                continue
+
+            row_widget, sender_label, subject_label, delete_btn, row_key = existing
+            new_key = self._row_key(email_data)
+            if new_key != row_key:
+                sender_label.setText(email_data.get("sender", "Unknown"))
+                subject_label.setText(self._subject_text(email_data))
+                # Refresh the delete IDs: the thread's email IDs may
+                # have changed even if the representative didn't
+                delete_btn.setProperty(
+                    "thread_email_ids",
+                    email_data.get("thread_email_ids", [email_id]),
+                )
+                self._rows[email_id] = (
+                    row_widget,
+                    sender_label,
+                    subject_label,
+                    delete_btn,
+                    new_key,
+                )
+
+            # Keep layout position in sync (insertWidget moves widgets
+            # that are already in the layout)
+            if self.content_layout.indexOf(row_widget) != index:
+                self.content_layout.insertWidget(index, row_widget)
+
+        # Rows beyond the visible range stay as data only
+        self._pending_emails = list(emails[capacity:])
+        self._update_filler()
+
+        # Switch between the pre-built empty and list pages
+        self.stack.setCurrentIndex(0 if not emails else 1)
+        self._resize_to_content()
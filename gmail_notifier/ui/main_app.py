@@ -6,9 +6,11 @@ This module contains the GmailNotifier class which orchestrates the
 system tray icon, email checking, notifications, and overall application state.
 """
 
+import queue
 import sys
 import threading
-import webbrowser
+from functools import partial
+from operator import itemgetter
 
 from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction
 from PyQt5.QtCore import QTimer, QThread
@@ -17,22 +19,18 @@ from PyQt5.QtGui import QIcon, QCursor
 from gmail_notifier.config import load_settings, save_settings
 from gmail_notifier.tray_icon import get_gmail_icon, create_badge_icon
 from gmail_notifier.snooze import SnoozeManager
-from gmail_notifier.email_utils import (
-    dedup_emails,
-    group_by_thread,
-    find_thread_email_ids,
-    remove_emails_by_ids,
-    augment_grouped_with_thread_ids,
-)
-from gmail_notifier.email_actions import delete_emails_imap
+from gmail_notifier.email_utils import thread_key
+from gmail_notifier.email_actions import delete_emails_imap, close_imap_connection
 from gmail_notifier.notifications import (
     show_email_notification,
-    show_summary_notification,
+    show_grouped_notification,
     show_error_notification,
 )
 from gmail_notifier.checker import GmailChecker
-from gmail_notifier.ui.config_dialog import ConfigDialog
-from gmail_notifier.ui.email_popup import EmailListPopup
+
+# webbrowser, ConfigDialog and EmailListPopup are imported lazily in
+# the methods that use them - none are needed to get the tray icon on
+# screen, and deferring them shortens cold startup
 
 
 class GmailNotifier:
@@ -45,20 +43,59 @@ class GmailNotifier:
     - Email popup window
     - Configuration dialog
 
-    The source of truth for emails is `_all_emails` (ungrouped).
-    `current_emails` is derived from it (grouped by thread) for display.
+    The source of truth for emails is `_all_emails`, a dict keyed by
+    email ID (insertion-ordered, newest first). `current_emails` is
+    derived from it (grouped by thread) for display.
 
     Attributes:
         app: QApplication instance.
         settings: Dict of configuration settings.
         tray_icon: QSystemTrayIcon for system tray.
         current_emails: List of emails grouped by thread (for display).
-        _all_emails: List of all ungrouped emails (source of truth).
+        _all_emails: Dict of email ID -> email dict (source of truth).
         popup: Current EmailListPopup instance or None.
         snooze_manager: SnoozeManager instance for notification snooze state.
     """
 
-    # Maximum number of individual notifications to show
+    # Slots instead of a per-instance __dict__: the attributes are hit
+    # constantly from tray/poll/notification callbacks. __weakref__
+    # must stay in the list - PyQt holds a weak reference to the
+    # receiver when a signal is connected to a bound method, and a
+    # slotted class without it cannot be weak-referenced
+    __slots__ = (
+        "__weakref__",
+        "app",
+        "settings",
+        "tray_icon",
+        "menu",
+        "check_now_action",
+        "open_gmail_action",
+        "snooze_action",
+        "config_action",
+        "quit_action",
+        "checker_thread",
+        "gmail_checker",
+        "snooze_manager",
+        "popup",
+        "click_timer",
+        "is_error",
+        "current_emails",
+        "notified_thread_ids",
+        "_all_emails",
+        "_threads",
+        "_base_icon",
+        "_last_icon_state",
+        "_last_id_set",
+        "_recheck_timer",
+        "_tray_update_timer",
+        "_tray_snoozed_hint",
+        "_delete_queue",
+        "_delete_worker",
+        "_pending_delete_ids",
+        "_delete_flush_timer",
+    )
+
+    # Maximum sender/subject preview lines in a grouped notification
     MAX_NOTIFICATIONS = 5
 
     def __init__(self):
@@ -67,12 +104,21 @@ class GmailNotifier:
         self.app.setQuitOnLastWindowClosed(False)
         self.app.setApplicationName("Gmail Notifier")
         self.app.setDesktopFileName("gmail-notifier")
-        self.app.setWindowIcon(get_gmail_icon())
+
+        # Resolve the base icon once; every window/tray/badge use below
+        # shares this QIcon instead of re-running the resolver
+        self._base_icon = get_gmail_icon()
+        self.app.setWindowIcon(self._base_icon)
 
         # Email storage
-        # _all_emails: ungrouped individual emails (source of truth)
+        # _all_emails: email ID -> email dict (source of truth), kept
+        # in newest-first insertion order; dict keying makes removal
+        # O(1) per ID
+        # _threads: thread key -> list of its emails, kept in sync so
+        # removals only touch the affected buckets
         # current_emails: grouped by thread (derived, for display)
-        self._all_emails = []
+        self._all_emails = {}
+        self._threads = {}
         self.current_emails = []
 
         # Track notified thread IDs to avoid duplicate notifications
@@ -84,31 +130,74 @@ class GmailNotifier:
         # Error tracking
         self.is_error = False
 
+        # Last rendered tray badge state (has_unread, is_snoozed, is_error)
+        self._last_icon_state = None
+
+        # Email ID set from the last processed poll
+        self._last_id_set = None
+
         # Click timer for single/double click differentiation
         self.click_timer = QTimer()
         self.click_timer.setSingleShot(True)
         self.click_timer.setInterval(300)  # 300ms delay
         self.click_timer.timeout.connect(self._on_single_click)
 
+        # Coalescing timer for the delayed server re-check scheduled
+        # after the user opens emails; restarting it merges a burst of
+        # reads into one poll
+        self._recheck_timer = QTimer()
+        self._recheck_timer.setSingleShot(True)
+        self._recheck_timer.setInterval(20000)
+        self._recheck_timer.timeout.connect(self.check_now)
+
+        # Coalescing timer for tray icon refreshes: multiple requests
+        # in the same event-loop turn collapse into one repaint
+        self._tray_snoozed_hint = None
+        self._tray_update_timer = QTimer()
+        self._tray_update_timer.setSingleShot(True)
+        self._tray_update_timer.setInterval(0)
+        self._tray_update_timer.timeout.connect(self._flush_tray_update)
+
         # Email list popup reference
         self.popup = None
 
+        # One long-lived worker drains the delete queue, serializing
+        # all IMAP deletes over the shared connection instead of
+        # spawning a thread (and a LOGIN) per delete. None is the
+        # shutdown sentinel.
+        self._delete_queue = queue.Queue()
+        self._delete_worker = threading.Thread(
+            target=self._delete_worker_loop, daemon=True
+        )
+        self._delete_worker.start()
+
+        # Rapid successive deletes are coalesced: IDs accumulate here
+        # briefly and go to the worker as one batched IMAP job. A set
+        # makes submission idempotent - double-clicking delete on the
+        # same thread can't queue its UIDs twice
+        self._pending_delete_ids = set()
+        self._delete_flush_timer = QTimer()
+        self._delete_flush_timer.setSingleShot(True)
+        self._delete_flush_timer.setInterval(200)
+        self._delete_flush_timer.timeout.connect(self._flush_pending_deletes)
+
         # Load settings
         self.settings = load_settings()
 
         # Create the system tray icon
         self.tray_icon = QSystemTrayIcon()
-        self.tray_icon.setIcon(get_gmail_icon())
+        self.tray_icon.setIcon(self._base_icon)
         self.tray_icon.setToolTip("Gmail Notifier")
 
         # Check if configuration is needed
         if not self.settings.get("username") or not self.settings.get("password"):
             self.show_config_dialog()
 
-        # Create context menu
-        self._setup_menu()
+        # Context menu is built lazily on the first right-click; most
+        # sessions never open it, so don't pay for the QMenu/QAction
+        # construction at startup
+        self.menu = None
 
-        self.tray_icon.setContextMenu(self.menu)
         self.tray_icon.activated.connect(self._on_tray_activated)
 
         # Start the email checking thread
@@ -118,8 +207,11 @@ class GmailNotifier:
         self.tray_icon.show()
         self.checker_thread.start()
 
-    def _setup_menu(self):
-        """Create the system tray context menu."""
+    def _ensure_menu(self):
+        """Create the system tray context menu on first use."""
+        if self.menu is not None:
+            return
+
         self.menu = QMenu()
 
         self.check_now_action = QAction("Check Now")
@@ -144,6 +236,9 @@ class GmailNotifier:
         self.quit_action.triggered.connect(self.quit)
         self.menu.addAction(self.quit_action)
 
+        # Sync the snooze label with the current state
+        self._update_snooze_ui(self.snooze_manager.is_snoozed())
+
     def _setup_checker_thread(self):
         """Initialize and configure the email checker thread."""
         self.checker_thread = QThread()
@@ -158,13 +253,50 @@ class GmailNotifier:
     # Tray Icon
     # -------------------------------------------------------------------------
 
-    def _update_tray_icon(self):
-        """Update tray icon with current state badges."""
+    def _request_tray_update(self, is_snoozed=None):
+        """Schedule a coalesced tray icon refresh.
+
+        Burst callers (poll + removal + snooze toggle in one turn)
+        share a single deferred repaint via a 0ms single-shot timer.
+
+        Args:
+            is_snoozed: Optional snooze snapshot forwarded to the
+                deferred update.
+        """
+        self._tray_snoozed_hint = is_snoozed
+        if not self._tray_update_timer.isActive():
+            self._tray_update_timer.start()
+
+    def _flush_tray_update(self):
+        """Run the actual tray icon update for a coalesced request."""
+        is_snoozed = self._tray_snoozed_hint
+        self._tray_snoozed_hint = None
+        self._update_tray_icon(is_snoozed)
+
+    def _update_tray_icon(self, is_snoozed=None):
+        """Update tray icon with current state badges.
+
+        Skips the badge composition and tray roundtrip entirely when
+        the state is the same as the last rendered one - the common
+        case on every poll where nothing changed.
+
+        Args:
+            is_snoozed: Optional precomputed snooze state; callers
+                that already snapshotted it pass it down so the clock
+                is read once per event. Queried from the snooze
+                manager when omitted.
+        """
         has_unread = len(self._all_emails) > 0
-        is_snoozed = self.snooze_manager.is_snoozed()
+        if is_snoozed is None:
+            is_snoozed = self.snooze_manager.is_snoozed()
+
+        state = (has_unread, is_snoozed, self.is_error)
+        if state == self._last_icon_state:
+            return
+        self._last_icon_state = state
 
         icon = create_badge_icon(
-            get_gmail_icon(), has_unread, is_snoozed, self.is_error
+            self._base_icon, has_unread, is_snoozed, self.is_error
         )
         self.tray_icon.setIcon(icon)
 
@@ -181,6 +313,10 @@ class GmailNotifier:
             # Double click - cancel single click and open Gmail
             self.click_timer.stop()
             self.open_gmail()
+        elif reason == QSystemTrayIcon.Context:
+            # Right click - build the menu on first use, then show it
+            self._ensure_menu()
+            self.menu.popup(QCursor.pos())
 
     def _on_single_click(self):
         """Handle confirmed single click (timer expired)."""
@@ -190,29 +326,40 @@ class GmailNotifier:
     # Email State Management
     # -------------------------------------------------------------------------
 
-    def _update_email_state(self, emails):
-        """Update email state from new email list.
+    def _update_email_state(self, deduped, grouped, is_snoozed=None):
+        """Update email state from a processed check result.
 
         This is the central method for updating email state. It:
-        1. Deduplicates emails
-        2. Stores ungrouped emails as source of truth
-        3. Derives grouped emails for display
-        4. Updates tray icon
+        1. Stores ungrouped emails as source of truth
+        2. Stores the grouped emails for display
+        3. Updates tray icon
+
+        Dedup and grouping already happened in the checker thread via
+        ingest_emails, so this only swaps references and refreshes UI.
 
         Args:
-            emails: List of email dicts from checker.
+            deduped: List of deduplicated email dicts, newest first.
+            grouped: Same emails grouped by thread, newest first.
+            is_snoozed: Optional snooze snapshot forwarded to the tray
+                update.
         """
-        # Deduplicate by ID
-        emails = dedup_emails(emails)
+        # Store ungrouped emails keyed by ID (source of truth);
+        # ingest_emails already normalized the IDs to strings and
+        # sorted newest first, which the dict preserves
+        self._all_emails = {e["id"]: e for e in deduped}
 
-        # Store ungrouped emails (source of truth)
-        self._all_emails = emails
+        # Rebuild the per-thread index in the same pass; buckets keep
+        # the newest-first order of deduped
+        threads = {}
+        for e in deduped:
+            threads.setdefault(thread_key(e), []).append(e)
+        self._threads = threads
 
-        # Derive grouped emails for display
-        self.current_emails = group_by_thread(emails)
+        # Grouped emails for display
+        self.current_emails = grouped
 
         # Update tray icon
-        self._update_tray_icon()
+        self._request_tray_update(is_snoozed)
 
         # Update popup if visible
         if self.popup is not None and self.popup.isVisible():
@@ -221,12 +368,53 @@ class GmailNotifier:
     def _remove_emails_from_state(self, email_ids):
         """Remove emails from local state by IDs.
 
+        Only the thread buckets the removed emails belonged to are
+        touched; the rest of the grouped view is reused as-is instead
+        of regrouping the whole inbox.
+
         Args:
             email_ids: List of email ID strings to remove.
         """
-        self._all_emails = remove_emails_by_ids(self._all_emails, email_ids)
-        self.current_emails = group_by_thread(self._all_emails)
-        self._update_tray_icon()
+        # Pop directly from the ID-keyed dict and patch the affected
+        # thread buckets
+        changed_keys = set()
+        for email_id in email_ids:
+            email = self._all_emails.pop(str(email_id), None)
+            if email is None:
+                continue
+            key = thread_key(email)
+            bucket = self._threads.get(key)
+            if bucket is not None:
+                bucket[:] = [e for e in bucket if e["id"] != email["id"]]
+                if not bucket:
+                    del self._threads[key]
+            changed_keys.add(key)
+
+        if changed_keys:
+            # Refresh display entries for the touched threads only;
+            # buckets are newest-first, so bucket[0] is the new
+            # representative of a shrunk thread
+            current = []
+            for entry in self.current_emails:
+                key = thread_key(entry)
+                if key not in changed_keys:
+                    current.append(entry)
+                    continue
+                bucket = self._threads.get(key)
+                if not bucket:
+                    continue
+                representative = bucket[0].copy()
+                representative["thread_count"] = len(bucket)
+                current.append(representative)
+            current.sort(key=itemgetter("timestamp"), reverse=True)
+            self.current_emails = current
+
+        # Local state now diverges from the last server snapshot, so
+        # the next poll must not be skipped as "unchanged" - otherwise
+        # a still-unread email removed locally would never come back
+        self._last_id_set = None
+
+        self._request_tray_update()
 
     # -------------------------------------------------------------------------
     # Email Actions
@@ -241,8 +429,10 @@ class GmailNotifier:
         self._remove_emails_from_state([email_id])
 
         # Trigger a full check from server after 20 seconds
-        # This gives time for the user to read/archive the email
-        QTimer.singleShot(20000, self.check_now)
+        # This gives time for the user to read/archive the email;
+        # restarting the timer folds rapid successive reads into a
+        # single check
+        self._recheck_timer.start()
 
     def delete_email(self, email_ids_str):
         """Delete all emails in a thread by moving to trash.
@@ -261,18 +451,39 @@ class GmailNotifier:
         # Re-show the popup with updated emails
         self.show_popup(check_mail=False)
 
-        # Run IMAP delete in background
-        username = self.settings.get("username", "")
-        password = self.settings.get("password", "")
+        # Accumulate and (re)start the flush timer; deletes landing
+        # within the window share a single IMAP round-trip
+        self._pending_delete_ids.update(email_ids_to_delete)
+        self._delete_flush_timer.start()
 
-        def do_delete():
+    def _flush_pending_deletes(self):
+        """Hand accumulated delete IDs to the worker as one batched job."""
+        if not self._pending_delete_ids:
+            return
+        email_ids = list(self._pending_delete_ids)
+        self._pending_delete_ids.clear()
+        self._delete_queue.put(email_ids)
+
+    def _delete_worker_loop(self):
+        """Execute queued IMAP delete jobs, one at a time.
+
+        Runs in a background thread for the lifetime of the app,
+        reusing the cached IMAP connection across jobs. Exits when the
+        None sentinel is queued at shutdown.
+        """
+        while True:
+            email_ids = self._delete_queue.get()
+            if email_ids is None:
+                break
+            username = self.settings.get("username", "")
+            password = self.settings.get("password", "")
             try:
-                delete_emails_imap(username, password, email_ids_to_delete)
+                delete_emails_imap(username, password, email_ids)
             except Exception as e:
                 error_msg = f"Failed to delete thread: {str(e)}"
-                QTimer.singleShot(0, lambda: self._on_error(error_msg))
-
-        threading.Thread(target=do_delete, daemon=True).start()
+                # partial is a C-level callable - no closure cell per
+                # dispatch, and no late-binding surprise on error_msg
+                QTimer.singleShot(0, partial(self._on_error, error_msg))
 
     def check_now(self):
         """Trigger an immediate email check."""
@@ -280,6 +491,8 @@ class GmailNotifier:
 
     def open_gmail(self):
         """Open Gmail in the default web browser."""
+        import webbrowser
+
         webbrowser.open(self.settings.get("gmail_url", "https://mail.google.com"))
 
     # -------------------------------------------------------------------------
@@ -292,26 +505,50 @@ class GmailNotifier:
         Args:
             check_mail: If True, trigger a mail check when opening.
         """
-        # Close any existing popup
-        if self.popup is not None:
-            self.popup.close()
-            self.popup.deleteLater()
-            self.popup = None
-
         # Trigger email check if requested
         if check_mail:
             self.check_now()
 
-        # Create and configure popup
+        if self.popup is None:
+            # Defer first-time construction one event-loop tick so the
+            # tray click handler returns (and the click feedback paints)
+            # before the stylesheet parse and row construction run
+            QTimer.singleShot(0, self._show_popup_now)
+        else:
+            self._show_popup_now()
+
+    def _show_popup_now(self):
+        """Build the popup if needed, refresh its contents, and show it."""
         gmail_url = self.settings.get("gmail_url", "https://mail.google.com")
-        # Augment emails with thread_email_ids to capture state at popup creation time
-        emails_with_thread_ids = augment_grouped_with_thread_ids(
-            self.current_emails, self._all_emails
-        )
-        self.popup = EmailListPopup(emails_with_thread_ids, gmail_url)
-        self.popup.email_clicked.connect(self.mark_email_read_locally)
-        self.popup.delete_requested.connect(self.delete_email)
-        self.popup.reshow_requested.connect(lambda: self.show_popup(check_mail=False))
+        # Attach thread_email_ids from the maintained thread index to
+        # capture state at popup display time; one bucket lookup per
+        # thread instead of rescanning all emails for each entry
+        emails_with_thread_ids = []
+        for entry in self.current_emails:
+            email_copy = entry.copy()
+            bucket = self._threads.get(thread_key(entry))
+            if bucket:
+                email_copy["thread_email_ids"] = [e["id"] for e in bucket]
+            else:
+                email_copy["thread_email_ids"] = [entry["id"]]
+            emails_with_thread_ids.append(email_copy)
+
+        # Create the popup once and reuse it; construction is expensive
+        # (stylesheet parsing + one widget row per thread)
+        if self.popup is None:
+            from gmail_notifier.ui.email_popup import EmailListPopup
+
+            self.popup = EmailListPopup(emails_with_thread_ids, gmail_url)
+            self.popup.email_clicked.connect(self.mark_email_read_locally)
+            self.popup.delete_requested.connect(self.delete_email)
+            self.popup.reshow_requested.connect(partial(self.show_popup, check_mail=False))
+            # Drop the cached reference if Qt ever tears the widget
+            # down (e.g. at shutdown), so we rebuild instead of calling
+            # into a deleted C++ object
+            self.popup.destroyed.connect(self._on_popup_destroyed)
+        else:
+            self.popup.set_gmail_url(gmail_url)
+            self.popup.update_emails(emails_with_thread_ids)
 
         # Position near cursor
         cursor_pos = QCursor.pos()
@@ -320,8 +557,13 @@ class GmailNotifier:
 
         self.popup.move(x, y)
         self.popup.show()
+        self.popup.raise_()
         self.popup.activateWindow()
 
+    def _on_popup_destroyed(self, _obj=None):
+        """Forget the popup when its underlying widget is destroyed."""
+        self.popup = None
+
     # -------------------------------------------------------------------------
     # Snooze
     # -------------------------------------------------------------------------
@@ -344,101 +586,145 @@ class GmailNotifier:
             is_snoozed: Current snooze state.
         """
         if is_snoozed:
-            self.snooze_action.setText("Unsnooze")
             self.tray_icon.setToolTip("Gmail Notifier (Snoozed)")
         else:
-            self.snooze_action.setText("Snooze for 1 hour")
             self.tray_icon.setToolTip("Gmail Notifier")
-        self._update_tray_icon()
+        # The menu (and its snooze action) may not be built yet
+        if self.menu is not None:
+            self.snooze_action.setText(
+                "Unsnooze" if is_snoozed else "Snooze for 1 hour"
+            )
+        self._request_tray_update(is_snoozed)
 
     # -------------------------------------------------------------------------
     # Notifications
     # -------------------------------------------------------------------------
 
-    def _on_new_emails(self, emails):
+    def _on_new_emails(self, emails, grouped):
         """Handle new emails signal from GmailChecker.
 
         Args:
-            emails: List of email dicts from the checker.
+            emails: List of deduplicated email dicts from the checker.
+            grouped: Same emails grouped by thread.
         """
+        # Snapshot snooze state once per poll; is_snoozed() reads the
+        # clock and can flip mid-function when the snooze expires,
+        # which would make the notification decision inconsistent
+        snoozed_now = self.snooze_manager.is_snoozed()
+
+        # When the server returns the same ID set as the last processed
+        # poll, the state swap, tray update and notification filtering
+        # below would all be no-ops - skip them. An active error or a
+        # snooze flip since the last rendered badge still falls
+        # through so the icon gets refreshed; the snooze state is
+        # time-dependent and can change with no mail activity at all.
+        # Comparing the ID sets themselves (not a hash) rules out
+        # collision false-positives.
+        new_id_set = frozenset(e["id"] for e in emails)
+        if (
+            new_id_set == self._last_id_set
+            and not self.is_error
+            and self._last_icon_state is not None
+            and self._last_icon_state[1] == snoozed_now
+        ):
+            return
+        self._last_id_set = new_id_set
+
         # Clear error state on successful check
         self.is_error = False
 
-        # Update email state (dedup, store, group, update UI)
-        self._update_email_state(emails)
+        # Update email state (store, update UI); the checker thread
+        # already deduped and grouped
+        self._update_email_state(emails, grouped, snoozed_now)
 
-        # Clean up notified_thread_ids: only keep thread IDs still on server
-        server_thread_ids = {str(e.get("thread_id")) for e in emails if e.get("thread_id")}
-        self.notified_thread_ids = self.notified_thread_ids & server_thread_ids
+        # Clean up notified_thread_ids: only keep thread IDs still on
+        # server (mutated in place to avoid allocating a new set per poll).
+        # Thread IDs were normalized to strings at ingest. When nothing
+        # has been notified yet there's nothing to prune, so don't pay
+        # for building the server-side set at all.
+        if self.notified_thread_ids:
+            server_thread_ids = {e["thread_id"] for e in emails if e.get("thread_id")}
+            self.notified_thread_ids.intersection_update(server_thread_ids)
 
         if not emails:
             return
 
-        # Filter out emails from already notified threads
-        new_emails = [
-            e for e in emails 
-            if e.get("thread_id") and str(e["thread_id"]) not in self.notified_thread_ids
-        ]
-        if not new_emails:
+        # Check if snoozed - skip notifications but don't mark as notified
+        if snoozed_now:
             return
 
-        # Check if snoozed - skip notifications but don't mark as notified
-        if self.snooze_manager.is_snoozed():
+        # Single pass over the (newest-first) emails: collect a
+        # representative for the first MAX_NOTIFICATIONS unseen
+        # threads and just count the rest, so a huge backlog after
+        # downtime never materializes a full per-email list
+        notified = self.notified_thread_ids
+        new_threads = {}
+        for e in emails:
+            tid = e.get("thread_id")
+            if not tid or tid in notified:
+                continue
+            if tid in new_threads:
+                rep = new_threads[tid]
+                if rep is not None:
+                    rep["thread_count"] += 1
+                continue
+            if len(new_threads) < self.MAX_NOTIFICATIONS:
+                rep = e.copy()
+                rep["thread_count"] = 1
+                new_threads[tid] = rep
+            else:
+                # Beyond the preview cap - counted but not previewed
+                new_threads[tid] = None
+
+        if not new_threads:
             return
 
-        # Send notifications (grouped by thread, with delay between each)
-        self._send_notifications(new_emails)
+        threads_to_notify = [rep for rep in new_threads.values() if rep is not None]
+        extra_count = len(new_threads) - len(threads_to_notify)
+        self._send_notifications(threads_to_notify, extra_count)
 
-        # Mark all threads as notified
-        for email_item in new_emails:
-            if email_item.get("thread_id"):
-                self.notified_thread_ids.add(str(email_item["thread_id"]))
+        # Mark all new threads as notified in one C-level update
+        notified.update(new_threads)
 
-    def _send_notifications(self, new_emails):
-        """Send notifications for new emails, grouped by thread.
+    def _send_notifications(self, threads_to_notify, extra_count):
+        """Send notifications for new email threads.
 
-        Groups emails by thread first, then shows one notification per thread
-        up to MAX_NOTIFICATIONS, with a summary for any remaining threads.
+        A single new thread gets its own detailed notification. Several
+        new threads get one grouped notification listing the collected
+        senders/subjects - one notify-send call instead of a chain of
+        delayed per-thread popups.
 
         Args:
-            new_emails: List of new email dicts to notify about.
+            threads_to_notify: Representative email dicts, one per new
+                thread, each carrying 'thread_count'.
+            extra_count: Number of additional new threads beyond the
+                preview cap.
         """
-        # Group by thread to send only one notification per thread
-        grouped_emails = group_by_thread(new_emails)
-        
-        threads_to_notify = grouped_emails[: self.MAX_NOTIFICATIONS]
-        extra_thread_count = len(grouped_emails) - self.MAX_NOTIFICATIONS
-
-        # Send individual notifications with 300ms delay between each
-        for i, thread_email in enumerate(threads_to_notify):
-            delay = i * 300
+        if len(threads_to_notify) == 1 and extra_count == 0:
+            thread_email = threads_to_notify[0]
             thread_count = thread_email.get("thread_count", 1)
-            
+
             # Update subject to show thread count if > 1
             subject = thread_email["subject"]
             if thread_count > 1:
                 subject = f"{subject} ({thread_count} unread)"
-            
-            QTimer.singleShot(
-                delay,
-                lambda e=thread_email, s=subject: show_email_notification(
-                    self.tray_icon,
-                    e["sender"],
-                    s,
-                    e.get("link"),
-                    self._snooze_from_notification,
-                ),
-            )
 
-        # Show summary if there are more threads
-        if extra_thread_count > 0:
-            delay = len(threads_to_notify) * 300
-            QTimer.singleShot(
-                delay,
-                lambda: show_summary_notification(
-                    self.tray_icon, extra_thread_count, self._snooze_from_notification
-                ),
+            show_email_notification(
+                self.tray_icon,
+                thread_email["sender"],
+                subject,
+                thread_email.get("link"),
+                self._snooze_from_notification,
             )
+            return
+
+        # Multiple new threads: one grouped notification
+        show_grouped_notification(
+            self.tray_icon,
+            threads_to_notify,
+            extra_count=extra_count,
+            snooze_callback=self._snooze_from_notification,
+        )
 
     def _on_error(self, error_msg):
         """Handle error signal from GmailChecker.
@@ -447,7 +733,7 @@ class GmailNotifier:
             error_msg: Error message string to display.
         """
         self.is_error = True
-        self._update_tray_icon()
+        self._request_tray_update()
         show_error_notification(self.tray_icon, error_msg)
 
     # -------------------------------------------------------------------------
@@ -456,6 +742,8 @@ class GmailNotifier:
 
     def show_config_dialog(self):
         """Show the configuration dialog."""
+        from gmail_notifier.ui.config_dialog import ConfigDialog
+
         dialog = ConfigDialog(self.settings, self.tray_icon)
         if dialog.exec_():
             self.settings = dialog.settings
@@ -470,6 +758,12 @@ class GmailNotifier:
         self.gmail_checker.running = False
         self.checker_thread.quit()
         self.checker_thread.wait()
+        # Let pending deletes drain before dropping the connection
+        self._delete_flush_timer.stop()
+        self._flush_pending_deletes()
+        self._delete_queue.put(None)
+        self._delete_worker.join(timeout=5)
+        close_imap_connection()
         self.app.quit()
 
     def run(self):